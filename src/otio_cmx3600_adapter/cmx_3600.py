@@ -12,10 +12,11 @@
 # TODO: currently tracks with linked audio/video will lose their linkage when
 #       read into OTIO.
 
+import collections
 import copy
+import functools
 import os
 import re
-import collections
 
 from opentimelineio import (
     exceptions,
@@ -33,6 +34,20 @@ SPEED_EFFECT_RE = re.compile(
     r"(?P<name>.*?)\s*(?P<speed>-?[0-9\.]*)\s*(?P<tc>[0-9:]{11})$"
 )
 
+# regex for the edit number at the start of an event line. Any line that
+# doesn't start with one is a comment or header line.
+EDIT_NUMBER_RE = re.compile(r'\d+')
+
+# regex for matching an image sequence in a media reference, e.g.
+# /path/filename.[1001-1020].ext
+IMAGE_SEQUENCE_RE = re.compile(
+    r'.*\.(?P<range>\[(?P<start>[0-9]+)-(?P<end>[0-9]+)\])\.\w+$'
+)
+
+# regexes used to derive a reel name from a file name
+REEL_EXTENSION_RE = re.compile(r'([.][a-zA-Z]+)$')
+REEL_INVALID_CHARS_RE = re.compile(r'[^ a-zA-Z0-9]+')
+
 
 # these are all CMX_3600 transition codes
 # the wipe is written in regex format because it is W### where the ### is
@@ -52,11 +67,32 @@ transition_regex_map = {
 # This channel_map tells you which track to use for each channel shorthand.
 # Channels not listed here are used as track names verbatim.
 channel_map = {
-    'A': ['A1'],
-    'AA': ['A1', 'A2'],
-    'B': ['V', 'A1'],
-    'A2/V': ['V', 'A2'],
-    'AA/V': ['V', 'A1', 'A2']
+    'A': ('A1',),
+    'AA': ('A1', 'A2'),
+    'B': ('V', 'A1'),
+    'A2/V': ('V', 'A2'),
+    'AA/V': ('V', 'A1', 'A2')
+}
+
+# Generator kinds for the reels called out as "Special Source Identifiers"
+# TODO: Replace with enum, once one exists
+_SPECIAL_SOURCE_GENERATOR_KINDS = {
+    'BL': 'black',
+    'BLACK': 'black',
+    'BARS': 'SMPTEBars',
+}
+
+# OTIO transition types for the fixed CMX_3600 transition codes the reader
+# supports. Wipes carry a variable code and are checked by _is_wipe.
+_OTIO_TRANSITION_TYPES = {
+    'D': schema.TransitionTypes.SMPTE_Dissolve,
+}
+
+# Track names starting with these characters get the given kind, anything
+# else is assumed to be video.
+_TRACK_KIND_BY_PREFIX = {
+    'V': schema.TrackKind.Video,
+    'A': schema.TrackKind.Audio,
 }
 
 
@@ -76,6 +112,36 @@ VALID_EDL_STYLES = {
 }
 
 
+# Names of the colors a marker can have, e.g. 'RED'
+_MARKER_COLORS = frozenset(
+    name for name in vars(schema.MarkerColor) if name.isupper()
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _from_timecode(timecode, rate):
+    # EDLs repeat the same timecodes a lot (an event's record out is usually
+    # the next event's record in) and RationalTime is an immutable value
+    # type, so the parsed results can be shared.
+    return opentime.from_timecode(timecode, rate)
+
+
+@functools.lru_cache(maxsize=64)
+def _zero_time(rate):
+    # Share one (immutable) zero RationalTime per rate
+    return opentime.RationalTime(0, rate)
+
+
+@functools.lru_cache(maxsize=4096)
+def _range_from_timecodes(start_timecode, end_timecode, rate):
+    # TimeRange is immutable too. An image sequence's available range and
+    # its clip's source range come from the same pair of timecodes.
+    return opentime.range_from_start_end_time(
+        _from_timecode(start_timecode, rate),
+        _from_timecode(end_timecode, rate)
+    )
+
+
 def _extend_source_range_duration(obj, duration):
     obj.source_range = obj.source_range.duration_extended_by(duration)
 
@@ -88,6 +154,10 @@ class EDLParser:
         # This dict maps a track name (e.g "A2" or "V") to an OTIO Track.
         self.tracks_by_name = {}
 
+        # This dict caches the list of tracks each channel code (e.g. "AA/V")
+        # expands to, so it is only worked out the first time we see it.
+        self.tracks_by_channel = {}
+
         self.ignore_timecode_mismatch = ignore_timecode_mismatch
 
         self.parse_edl(edl_string, rate=rate)
@@ -104,13 +174,12 @@ class EDLParser:
         )
         clip = clip_handler.clip
         transition = clip_handler.transition
+        # Collect the cmx_3600 metadata and set it on the clip in one go.
+        cmx_metadata = {}
+
         # Add unhandled comments as general comments to meta data.
         if comment_handler.unhandled:
-            clip.metadata.setdefault("cmx_3600", {})
-            clip.metadata['cmx_3600'].setdefault("comments", [])
-            clip.metadata['cmx_3600']['comments'] += (
-                comment_handler.unhandled
-            )
+            cmx_metadata['comments'] = comment_handler.unhandled
 
         # Add reel name to metadata
         # A reel name of `AX` represents an unknown or auxilary source
@@ -118,15 +187,17 @@ class EDLParser:
         # So lets skip adding AX reels as metadata for now,
         # as that would dirty json outputs with non-relevant information
         if clip_handler.reel and clip_handler.reel != 'AX':
-            clip.metadata.setdefault("cmx_3600", {})
-            clip.metadata['cmx_3600']['reel'] = clip_handler.reel
+            cmx_metadata['reel'] = clip_handler.reel
+
+        if cmx_metadata:
+            clip.metadata['cmx_3600'] = cmx_metadata
 
         edl_rate = clip_handler.edl_rate
-        record_in = opentime.from_timecode(
+        record_in = _from_timecode(
             clip_handler.record_tc_in,
             edl_rate
         )
-        record_out = opentime.from_timecode(
+        record_out = _from_timecode(
             clip_handler.record_tc_out,
             edl_rate
         )
@@ -177,23 +248,28 @@ class EDLParser:
 
         # Add clip instances to the tracks
         tracks = self.tracks_for_channel(clip_handler.channel_code)
-        for track in tracks:
-            track_transition = transition
-            if len(tracks) > 1:
-                track_clip = copy.deepcopy(clip)
-                if transition:
-                    track_transition = copy.deepcopy(transition)
-            else:
-                track_clip = clip
 
+        # The first track gets the clip (and transition) we just made, any
+        # other tracks get their own copies.
+        track_items = [(clip, transition)]
+        for _ in tracks[1:]:
+            track_items.append((
+                copy.deepcopy(clip),
+                copy.deepcopy(transition) if transition else None
+            ))
+
+        for track, (track_clip, track_transition) in zip(tracks, track_items):
             if track.source_range is None:
-                zero = opentime.RationalTime(0, edl_rate)
+                zero = _zero_time(edl_rate)
                 track.source_range = opentime.TimeRange(
                     start_time=zero - record_in,
                     duration=zero
                 )
 
-            track_end = track.duration() - track.source_range.start_time
+            # The track's source_range is extended as items are appended, so
+            # it doubles as a running record of where the track ends.
+            track_range = track.source_range
+            track_end = track_range.duration - track_range.start_time
             if record_in < track_end:
                 if self.ignore_timecode_mismatch:
                     # shift it over
@@ -214,7 +290,7 @@ class EDLParser:
             if record_in > track_end and len(track) > 0:
                 gap = schema.Gap()
                 gap.source_range = opentime.TimeRange(
-                    start_time=opentime.RationalTime(0, edl_rate),
+                    start_time=_zero_time(edl_rate),
                     duration=record_in - track_end
                 )
                 track.append(gap)
@@ -230,18 +306,17 @@ class EDLParser:
             _extend_source_range_duration(track, track_clip.duration())
 
     def guess_kind_for_track_name(self, name):
-        if name.startswith("V"):
-            return schema.TrackKind.Video
-        if name.startswith("A"):
-            return schema.TrackKind.Audio
-        return schema.TrackKind.Video
+        return _TRACK_KIND_BY_PREFIX.get(name[:1], schema.TrackKind.Video)
 
     def tracks_for_channel(self, channel_code):
+        tracks = self.tracks_by_channel.get(channel_code)
+        if tracks is not None:
+            return tracks
+
         # Expand channel shorthand into a list of track names.
-        if channel_code in channel_map:
-            track_names = channel_map[channel_code]
-        else:
-            track_names = [channel_code]
+        track_names = channel_map.get(channel_code)
+        if track_names is None:
+            track_names = (channel_code,)
 
         # Create any channels we don't already have
         for track_name in track_names:
@@ -254,7 +329,9 @@ class EDLParser:
                 self.timeline.tracks.append(track)
 
         # Return a list of actual tracks
-        return [self.tracks_by_name[c] for c in track_names]
+        tracks = [self.tracks_by_name[c] for c in track_names]
+        self.tracks_by_channel[channel_code] = tracks
+        return tracks
 
     def parse_edl(self, edl_string, rate=24):
         # edl 'events' can be comprised of an indeterminate amount of lines
@@ -264,18 +341,60 @@ class EDLParser:
         # precedes the clip
 
         # remove all blank lines from the edl
-        edl_lines = [
+        # lines are consumed from the front as they are parsed, so use a deque
+        # to make that O(1) rather than shifting a list on every line
+        edl_lines = collections.deque(
             line for line in
             (line.strip() for line in edl_string.splitlines()) if line
-        ]
+        )
 
         while edl_lines:
             # a basic for loop wont work cleanly since we need to look ahead at
             # array elements to determine what type of 'event' we are looking
             # at
-            line = edl_lines.pop(0)
+            line = edl_lines.popleft()
+
+            # Check if the first character in the line is a digit. Events make
+            # up the bulk of an edl so they are checked for first.
+            if line[0].isdecimal():
+                transition_line = None
+                # all 'events' start_time with an edit decision. this is
+                # denoted by the line beginning with a padded integer 000-999
+                comments = []
+                event_id = _parse_edit_number(line)
+                while edl_lines:
+                    # Any non-numbered lines after an edit decision should be
+                    # treated as 'comments'.
+                    # Comments are string tags used by the reader to get extra
+                    # information not able to be found in the restricted edl
+                    # format.
+                    # If the current event id is repeated it means that there is
+                    # a transition between the current event and the preceding
+                    # one. We collect it and process it when adding the clip.
+                    edit_number = _parse_edit_number(edl_lines[0])
+                    if edit_number is None:
+                        comments.append(edl_lines.popleft())
+                    else:
+                        if edit_number == event_id:
+                            # It is not possible to have multiple transitions
+                            # for the same event.
+                            if transition_line:
+                                raise EDLParseError(
+                                    'Invalid transition %s' % edl_lines[0]
+                                )
+                            # Same event id, this is a transition
+                            transition_line = edl_lines.popleft()
+                        else:
+                            # New event, stop collecting comments and transitions
+                            break
 
-            if line.startswith('TITLE:'):
+                self.add_clip(
+                    line,
+                    comments,
+                    rate=rate,
+                    transition_line=transition_line
+                )
+            elif line.startswith('TITLE:'):
                 # this is the first line of interest in an edl
                 # it is required to be in the header
                 self.timeline.name = line.replace('TITLE:', '').strip()
@@ -293,10 +412,12 @@ class EDLParser:
                 audio_delay = None
                 video_delay = None
 
+                # split() already strips surrounding whitespace
+                delay = line.split()[-1]
                 if 'AUDIO DELAY' in line:
-                    audio_delay = line.split()[-1].strip()
+                    audio_delay = delay
                 if 'VIDEO DELAY' in line:
-                    video_delay = line.split()[-1].strip()
+                    video_delay = delay
                 if audio_delay and video_delay:
                     raise EDLParseError(
                         'both audio and video delay declared after SPLIT.'
@@ -306,56 +427,17 @@ class EDLParser:
                         'either audio or video delay declared after SPLIT.'
                     )
 
-                line_1 = edl_lines.pop(0)
-                line_2 = edl_lines.pop(0)
+                line_1 = edl_lines.popleft()
+                line_2 = edl_lines.popleft()
                 # TODO: check if transitions can happen in this case
                 comments = []
                 while edl_lines:
-                    if re.match(r'^\D', edl_lines[0]):
-                        comments.append(edl_lines.pop(0))
+                    if _parse_edit_number(edl_lines[0]) is None:
+                        comments.append(edl_lines.popleft())
                     else:
                         break
                 self.add_clip(line_1, comments, rate=rate)
                 self.add_clip(line_2, comments, rate=rate)
-            # Check if the first character in the line is a digit
-            elif line[0].isdigit():
-                transition_line = None
-                # all 'events' start_time with an edit decision. this is
-                # denoted by the line beginning with a padded integer 000-999
-                comments = []
-                event_id = int(re.match(r'^\d+', line).group(0))
-                while edl_lines:
-                    # Any non-numbered lines after an edit decision should be
-                    # treated as 'comments'.
-                    # Comments are string tags used by the reader to get extra
-                    # information not able to be found in the restricted edl
-                    # format.
-                    # If the current event id is repeated it means that there is
-                    # a transition between the current event and the preceding
-                    # one. We collect it and process it when adding the clip.
-                    m = re.match(r'^\d+', edl_lines[0])
-                    if not m:
-                        comments.append(edl_lines.pop(0))
-                    else:
-                        if int(m.group(0)) == event_id:
-                            # It is not possible to have multiple transitions
-                            # for the same event.
-                            if transition_line:
-                                raise EDLParseError(
-                                    'Invalid transition %s' % edl_lines[0]
-                                )
-                            # Same event id, this is a transition
-                            transition_line = edl_lines.pop(0)
-                        else:
-                            # New event, stop collecting comments and transitions
-                            break
-
-                self.add_clip(
-                    line,
-                    comments,
-                    rate=rate,
-                    transition_line=transition_line
-                )
             else:
                 raise EDLParseError('Unknown event type')
 
@@ -368,9 +450,7 @@ class EDLParser:
 
 class ClipHandler:
     # /path/filename.[1001-1020].ext
-    image_sequence_pattern = re.compile(
-        r'.*\.(?P<range>\[(?P<start>[0-9]+)-(?P<end>[0-9]+)\])\.\w+$'
-    )
+    image_sequence_pattern = IMAGE_SEQUENCE_RE
 
     def __init__(self, line, comment_data, rate=24, transition_line=None):
         self.clip_num = None
@@ -394,14 +474,15 @@ class ClipHandler:
             self.transition = self.make_transition(comment_data)
 
     def is_image_sequence(self, comment_data):
-        return self.image_sequence_pattern.search(
+        return IMAGE_SEQUENCE_RE.search(
             comment_data['media_reference']
         ) is not None
 
-    def create_imagesequence_reference(self, comment_data):
-        regex_obj = self.image_sequence_pattern.search(
-            comment_data['media_reference']
-        )
+    def create_imagesequence_reference(self, comment_data, regex_obj=None):
+        if regex_obj is None:
+            regex_obj = IMAGE_SEQUENCE_RE.search(
+                comment_data['media_reference']
+            )
 
         path, basename = os.path.split(comment_data['media_reference'])
         prefix, suffix = basename.split(regex_obj.group('range'))
@@ -412,9 +493,10 @@ class ClipHandler:
             rate=self.edl_rate,
             start_frame=int(regex_obj.group('start')),
             frame_zero_padding=len(regex_obj.group('start')),
-            available_range=opentime.range_from_start_end_time(
-                opentime.from_timecode(self.source_tc_in, self.edl_rate),
-                opentime.from_timecode(self.source_tc_out, self.edl_rate)
+            available_range=_range_from_timecodes(
+                self.source_tc_in,
+                self.source_tc_out,
+                self.edl_rate
             )
         )
 
@@ -427,18 +509,19 @@ class ClipHandler:
         # BLACK/BL and BARS are called out as "Special Source Identifiers" in
         # the documents referenced here:
         # https://github.com/AcademySoftwareFoundation/OpenTimelineIO#cmx3600-edl
-        if self.reel in ['BL', 'BLACK']:
-            clip.media_reference = schema.GeneratorReference()
-            # TODO: Replace with enum, once one exists
-            clip.media_reference.generator_kind = 'black'
-        elif self.reel == 'BARS':
+        generator_kind = _SPECIAL_SOURCE_GENERATOR_KINDS.get(self.reel)
+        if generator_kind is not None:
             clip.media_reference = schema.GeneratorReference()
-            # TODO: Replace with enum, once one exists
-            clip.media_reference.generator_kind = 'SMPTEBars'
+            clip.media_reference.generator_kind = generator_kind
         elif 'media_reference' in comment_data:
-            if self.is_image_sequence(comment_data):
+            # search once and hand the match on rather than re-running it
+            sequence_match = IMAGE_SEQUENCE_RE.search(
+                comment_data['media_reference']
+            )
+            if sequence_match is not None:
                 clip.media_reference = self.create_imagesequence_reference(
-                    comment_data
+                    comment_data,
+                    sequence_match
                 )
             else:
                 clip.media_reference = schema.ExternalReference()
@@ -451,11 +534,12 @@ class ClipHandler:
         # this could currently break without a 'FROM CLIP' comment.
         # Without that there is no 'media_reference' Do we have a default
         # clip name?
+        # The media reference was made just above, so its exact type is known
+        media_reference_type = type(clip.media_reference)
         if 'clip_name' in comment_data:
             clip.name = comment_data["clip_name"]
         elif (
-            clip.media_reference and
-            hasattr(clip.media_reference, 'target_url') and
+            media_reference_type is schema.ExternalReference and
             clip.media_reference.target_url is not None
         ):
             clip.name = os.path.splitext(
@@ -463,8 +547,7 @@ class ClipHandler:
             )[0]
 
         elif (
-            clip.media_reference and
-            hasattr(clip.media_reference, 'target_url_base') and
+            media_reference_type is schema.ImageSequenceReference and
             clip.media_reference.target_url_base is not None
         ):
             clip.name = os.path.splitext(
@@ -480,23 +563,11 @@ class ClipHandler:
             sat = 1.0
 
             if asc_sop:
-                triple = r'([-+]?[\d.]+),? ([-+]?[\d.]+),? ([-+]?[\d.]+),?'
-                m = re.match(
-                    r'\('
-                    + triple
-                    + r'\)\s*\('
-                    + triple + r'\)\s*\('
-                    + triple + r'\)',
-                    asc_sop
-                )
-                if m:
-                    floats = [float(g) for g in m.groups()]
-                    slope = [floats[0], floats[1], floats[2]]
-                    offset = [floats[3], floats[4], floats[5]]
-                    power = [floats[6], floats[7], floats[8]]
-                else:
+                triples = _parse_asc_sop(asc_sop)
+                if triples is None:
                     raise EDLParseError(
                         f'Invalid ASC_SOP found: {asc_sop}')
+                slope, offset, power = triples
 
             if asc_sat:
                 sat = float(asc_sat)
@@ -524,18 +595,16 @@ class ClipHandler:
             # can handle more of them? Only real-world testing will
             # determine this for sure...
             for locator in comment_data['locators']:
-                m = re.match(
-                    r'(\d\d:\d\d:\d\d:\d\d)\s+(\w*)(\s+|$)(.*)',
-                    locator
-                )
-                if not m:
+                parsed = _parse_locator(locator)
+                if parsed is None:
                     # TODO: Should we report this as a warning somehow?
                     continue
+                marker_timecode, color_parsed_from_file, marker_name = parsed
 
                 marker = schema.Marker()
                 marker.marked_range = opentime.TimeRange(
-                    start_time=opentime.from_timecode(
-                        m.group(1),
+                    start_time=_from_timecode(
+                        marker_timecode,
                         self.edl_rate
                     ),
                     duration=opentime.RationalTime()
@@ -543,8 +612,6 @@ class ClipHandler:
 
                 # always write the source value into metadata, in case it
                 # is not a valid enum somehow.
-                color_parsed_from_file = m.group(2)
-
                 marker.metadata.update({
                     "cmx_3600": {
                         "color": color_parsed_from_file
@@ -552,26 +619,25 @@ class ClipHandler:
                 })
 
                 # @TODO: if it is a valid
-                if hasattr(
-                    schema.MarkerColor,
-                    color_parsed_from_file.upper()
-                ):
-                    marker.color = color_parsed_from_file.upper()
+                color = color_parsed_from_file.upper()
+                if color in _MARKER_COLORS:
+                    marker.color = color
                 else:
                     marker.color = schema.MarkerColor.RED
 
-                marker.name = m.group(4)
+                marker.name = marker_name
                 clip.markers.append(marker)
 
-        clip.source_range = opentime.range_from_start_end_time(
-            opentime.from_timecode(self.source_tc_in, self.edl_rate),
-            opentime.from_timecode(self.source_tc_out, self.edl_rate)
+        clip.source_range = _range_from_timecodes(
+            self.source_tc_in,
+            self.source_tc_out,
+            self.edl_rate
         )
 
         return clip
 
     def parse(self, line):
-        fields = tuple(e.strip() for e in line.split() if e.strip())
+        fields = tuple(line.split())
         field_count = len(fields)
 
         if field_count == 9:
@@ -607,7 +673,7 @@ class ClipHandler:
                 self.record_tc_out
             ) = fields
             # Double check it is a cut
-            if edit_type not in ["C"]:
+            if edit_type != 'C':
                 raise EDLParseError(
                     'incorrect edit type {} in form statement: {}'.format(
                         edit_type, line,
@@ -619,22 +685,21 @@ class ClipHandler:
                 ''.format(field_count, line))
 
         # Frame numbers (not just timecode) are ok
-        for prop in [
+        edl_rate = self.edl_rate
+        for prop in (
             'source_tc_in',
             'source_tc_out',
             'record_tc_in',
             'record_tc_out'
-        ]:
-            if ':' not in getattr(self, prop):
+        ):
+            value = getattr(self, prop)
+            if ':' not in value:
                 setattr(
                     self,
                     prop,
                     opentime.to_timecode(
-                        opentime.from_frames(
-                            int(getattr(self, prop)),
-                            self.edl_rate
-                        ),
-                        self.edl_rate
+                        opentime.from_frames(int(value), edl_rate),
+                        edl_rate
                     )
                 )
 
@@ -648,15 +713,16 @@ class ClipHandler:
                     self.transaction_id, self.clip_num,
                 )
             )
-        if re.match(r'W(\d{3})', self.transition_type):
+        otio_transition_type = _OTIO_TRANSITION_TYPES.get(
+            self.transition_type
+        )
+        if otio_transition_type is None:
+            if not _is_wipe(self.transition_type):
+                raise EDLParseError(
+                    "Transition type '{}' not supported by the CMX EDL reader "
+                    "currently.".format(self.transition_type)
+                )
             otio_transition_type = "SMPTE_Wipe"
-        elif self.transition_type in ['D']:
-            otio_transition_type = schema.TransitionTypes.SMPTE_Dissolve
-        else:
-            raise EDLParseError(
-                "Transition type '{}' not supported by the CMX EDL reader "
-                "currently.".format(self.transition_type)
-            )
         # TODO: support delayed transition like described here:
         # https://xmil.biz/EDL-X/CMX3600.pdf
         transition_duration = opentime.RationalTime(
@@ -708,6 +774,13 @@ class ClipHandler:
         return new_trx
 
 
+def _compile_comment_regexes(regex_template, comment_id_map):
+    return tuple(
+        (re.compile(regex_template.format(id=comment_id)), comment_type)
+        for comment_id, comment_type in comment_id_map.items()
+    )
+
+
 class CommentHandler:
     # this is the for that all comment 'id' tags take
     regex_template = r'\*?\s*{id}:?\s*(?P<comment_body>.*)'
@@ -716,18 +789,29 @@ class CommentHandler:
     # 'FROM CLIP' or 'FROM FILE' is a required comment to link media
     # An exception is raised if both 'FROM CLIP' and 'FROM FILE' are found
     # needs to be ordered so that FROM CLIP NAME gets matched before FROM CLIP
-    comment_id_map = collections.OrderedDict([
-        ('FROM CLIP NAME', 'clip_name'),
-        ('TO CLIP NAME', 'dest_clip_name'),
-        ('FROM CLIP', 'media_reference'),
-        ('FROM FILE', 'media_reference'),
-        ('LOC', 'locators'),
-        ('ASC_SOP', 'asc_sop'),
-        ('ASC_SAT', 'asc_sat'),
-        ('M2', 'motion_effect'),
-        ('\\* FREEZE FRAME', 'freeze_frame'),
-        ('\\* OTIO REFERENCE [a-zA-Z]+', 'media_reference'),
-    ])
+    # (dicts preserve insertion order)
+    comment_id_map = {
+        'FROM CLIP NAME': 'clip_name',
+        'TO CLIP NAME': 'dest_clip_name',
+        'FROM CLIP': 'media_reference',
+        'FROM FILE': 'media_reference',
+        'LOC': 'locators',
+        'ASC_SOP': 'asc_sop',
+        'ASC_SAT': 'asc_sat',
+        'M2': 'motion_effect',
+        '\\* FREEZE FRAME': 'freeze_frame',
+        '\\* OTIO REFERENCE [a-zA-Z]+': 'media_reference',
+    }
+
+    # (compiled regex, comment type) pairs, built once in match order
+    comment_regexes = _compile_comment_regexes(regex_template, comment_id_map)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # a subclass may override regex_template or comment_id_map
+        cls.comment_regexes = _compile_comment_regexes(
+            cls.regex_template, cls.comment_id_map
+        )
 
     def __init__(self, comments):
         self.handled = {}
@@ -736,18 +820,14 @@ class CommentHandler:
             self.parse(comment)
 
     def parse(self, comment):
-        for comment_id, comment_type in self.comment_id_map.items():
-            regex = self.regex_template.format(id=comment_id)
-            match = re.match(regex, comment)
+        for regex, comment_type in self.comment_regexes:
+            match = regex.match(comment)
             if match:
                 comment_body = match.group('comment_body').strip()
 
                 # Special case for locators. There can be multiple locators per clip.
                 if comment_type == 'locators':
-                    try:
-                        self.handled[comment_type].append(comment_body)
-                    except KeyError:
-                        self.handled[comment_type] = [comment_body]
+                    self.handled.setdefault(comment_type, []).append(comment_body)
 
                 else:
                     self.handled[comment_type] = comment_body
@@ -793,14 +873,41 @@ def read_from_string(input_str, rate=24, ignore_timecode_mismatch=False):
     return result
 
 
+def read_from_file(filepath, rate=24, ignore_timecode_mismatch=False):
+    """Reads a CMX Edit Decision List (EDL) from a file.
+    EDLs are usually plain ASCII, but some editing systems write
+    ISO-8859-1 (Latin-1) clip names. The file is read once as bytes and
+    decoded as UTF-8, falling back to ISO-8859-1 if that fails.
+    See read_from_string for a description of the other arguments.
+    """
+    with open(filepath, 'rb') as fo:
+        raw = fo.read()
+
+    try:
+        contents = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        contents = raw.decode('iso-8859-1')
+
+    return read_from_string(
+        contents,
+        rate=rate,
+        ignore_timecode_mismatch=ignore_timecode_mismatch
+    )
+
+
 def write_to_string(input_otio, rate=None, style='avid', reelname_len=8):
     # TODO: We should have convenience functions in Timeline for this?
     # also only works for a single video track at the moment
 
-    video_tracks = [t for t in input_otio.tracks
-                    if t.kind == schema.TrackKind.Video and t.enabled]
-    audio_tracks = [t for t in input_otio.tracks
-                    if t.kind == schema.TrackKind.Audio and t.enabled]
+    video_tracks = []
+    audio_tracks = []
+    for t in input_otio.tracks:
+        if not t.enabled:
+            continue
+        if t.kind == schema.TrackKind.Video:
+            video_tracks.append(t)
+        elif t.kind == schema.TrackKind.Audio:
+            audio_tracks.append(t)
 
     if len(video_tracks) != 1:
         raise exceptions.NotSupportedError(
@@ -849,12 +956,18 @@ class EDLWriter:
     def get_content_for_track_at_index(self, idx, title):
         track = self._tracks[idx]
 
+        content = f"TITLE: {title}\n\n" if title else ''
+
+        # Nothing to write, skip building events entirely.
+        if not track.enabled or not len(track):
+            return content
+
         # Add a gap if the last child is a transition.
         if isinstance(track[-1], schema.Transition):
             gap = schema.Gap(
                 source_range=opentime.TimeRange(
                     start_time=track[-1].duration(),
-                    duration=opentime.RationalTime(0.0, self._rate)
+                    duration=_zero_time(self._rate)
                 )
             )
             track.append(gap)
@@ -885,9 +998,24 @@ class EDLWriter:
 
                 # Just clean up the transition for goodness sake
                 in_offset = child.in_offset
-                child.in_offset = opentime.RationalTime(0.0, self._rate)
+                child.in_offset = _zero_time(self._rate)
                 child.out_offset += in_offset
 
+        # Work out where every child sits in the timeline in one go. Asking
+        # each clip for its own transformed range walks all of the clips
+        # before it, which makes writing quadratic in the number of events.
+        child_ranges = track.range_of_all_children()
+        zero = _zero_time(self._rate)
+        track_offset = track.transformed_time(zero, self._tracks) - zero
+        if track_offset.value:
+            child_ranges = {
+                child: opentime.TimeRange(
+                    child_range.start_time + track_offset,
+                    child_range.duration
+                )
+                for child, child_range in child_ranges.items()
+            }
+
         # Group events into either simple clip/a-side or transition and b-side
         # to match EDL edit/event representation and edit numbers.
         events = []
@@ -908,7 +1036,8 @@ class EDLWriter:
                         track.kind,
                         self._rate,
                         self._style,
-                        self._reelname_len
+                        self._reelname_len,
+                        range_in_timeline=child_ranges[child]
                     )
                 )
             elif isinstance(child, schema.Clip):
@@ -920,7 +1049,8 @@ class EDLWriter:
                             track.kind,
                             self._rate,
                             self._style,
-                            self._reelname_len
+                            self._reelname_len,
+                            range_in_timeline=child_ranges[child]
                         )
                     )
                 else:
@@ -930,34 +1060,32 @@ class EDLWriter:
                 # needed.
                 pass
 
-        content = f"TITLE: {title}\n\n" if title else ''
-        if track.enabled:
-            # Convert each event/dissolve-event into plain text.
-            for idx, event in enumerate(events):
-                event.edit_number = idx + 1
-                content += event.to_edl_format() + '\n'
-
-        return content
-
+        # Convert each event/dissolve-event into plain text.
+        lines = [content]
+        for idx, event in enumerate(events):
+            event.edit_number = idx + 1
+            lines.append(event.to_edl_format() + '\n')
 
-def _supported_timing_effects(clip):
-    return [
-        fx for fx in clip.effects
-        if isinstance(fx, schema.LinearTimeWarp)
-    ]
+        return ''.join(lines)
 
 
 def _relevant_timing_effect(clip):
-    # check to see if there is more than one timing effect
-    effects = _supported_timing_effects(clip)
-
-    if effects != clip.effects:
-        for thing in clip.effects:
-            if thing not in effects and isinstance(thing, schema.TimeEffect):
-                raise exceptions.NotSupportedError(
-                    "Clip contains timing effects not supported by the EDL"
-                    " adapter.\nClip: {}".format(str(clip)))
+    # most clips don't have any effects at all
+    if not clip.effects:
+        return None
+
+    # collect the supported timing effects in a single pass, bailing out on
+    # any timing effect we can't represent
+    effects = []
+    for fx in clip.effects:
+        if isinstance(fx, schema.LinearTimeWarp):
+            effects.append(fx)
+        elif isinstance(fx, schema.TimeEffect):
+            raise exceptions.NotSupportedError(
+                "Clip contains timing effects not supported by the EDL"
+                " adapter.\nClip: {}".format(str(clip)))
 
+    # check to see if there is more than one timing effect
     timing_effect = None
     if effects:
         timing_effect = effects[0]
@@ -977,7 +1105,8 @@ class Event:
         kind,
         rate,
         style,
-        reelname_len
+        reelname_len,
+        range_in_timeline=None
     ):
 
         # Premiere style uses AX for the reel name
@@ -1003,10 +1132,11 @@ class Event:
                 line.source_out = (
                     line.source_in + opentime.RationalTime(value, rate))
 
-        range_in_timeline = clip.transformed_time_range(
-            clip.trimmed_range(),
-            tracks
-        )
+        if range_in_timeline is None:
+            range_in_timeline = clip.transformed_time_range(
+                clip.trimmed_range(),
+                tracks
+            )
         line.record_in = range_in_timeline.start_time
         line.record_out = range_in_timeline.end_time_exclusive()
         self.line = line
@@ -1055,7 +1185,8 @@ class DissolveEvent:
         kind,
         rate,
         style,
-        reelname_len
+        reelname_len,
+        range_in_timeline=None
     ):
         # Note: We don't make the A-Side event line here as it is represented
         # by its own event (edit number).
@@ -1078,10 +1209,10 @@ class DissolveEvent:
             )
         else:
             cut_line.reel = 'BL'
-            cut_line.source_in = opentime.RationalTime(0.0, rate)
-            cut_line.source_out = opentime.RationalTime(0.0, rate)
-            cut_line.record_in = opentime.RationalTime(0.0, rate)
-            cut_line.record_out = opentime.RationalTime(0.0, rate)
+            cut_line.source_in = _zero_time(rate)
+            cut_line.source_out = _zero_time(rate)
+            cut_line.record_in = _zero_time(rate)
+            cut_line.record_out = _zero_time(rate)
 
         self.cut_line = cut_line
 
@@ -1092,10 +1223,11 @@ class DissolveEvent:
         )
         dslve_line.source_in = b_side_clip.source_range.start_time
         dslve_line.source_out = b_side_clip.source_range.end_time_exclusive()
-        range_in_timeline = b_side_clip.transformed_time_range(
-            b_side_clip.trimmed_range(),
-            tracks
-        )
+        if range_in_timeline is None:
+            range_in_timeline = b_side_clip.transformed_time_range(
+                b_side_clip.trimmed_range(),
+                tracks
+            )
         dslve_line.record_in = range_in_timeline.start_time
         dslve_line.record_out = range_in_timeline.end_time_exclusive()
         dslve_line.dissolve_length = transition.out_offset
@@ -1164,38 +1296,48 @@ class DissolveEvent:
 
 
 class EventLine:
+    # one of these is made per written event, so skip the per-instance dict
+    __slots__ = (
+        'reel',
+        '_kind',
+        '_rate',
+        'source_in',
+        'source_out',
+        'record_in',
+        'record_out',
+        'dissolve_length',
+    )
+
     def __init__(self, kind, rate, reel='AX'):
         self.reel = reel
         self._kind = 'V' if kind == schema.TrackKind.Video else 'A'
         self._rate = rate
 
-        self.source_in = opentime.RationalTime(0.0, rate=rate)
-        self.source_out = opentime.RationalTime(0.0, rate=rate)
-        self.record_in = opentime.RationalTime(0.0, rate=rate)
-        self.record_out = opentime.RationalTime(0.0, rate=rate)
+        self.source_in = _zero_time(rate)
+        self.source_out = _zero_time(rate)
+        self.record_in = _zero_time(rate)
+        self.record_out = _zero_time(rate)
 
-        self.dissolve_length = opentime.RationalTime(0.0, rate)
+        self.dissolve_length = _zero_time(rate)
 
     def to_edl_format(self, edit_number):
-        ser = {
-            'edit': edit_number,
-            'reel': self.reel,
-            'kind': self._kind,
-            'src_in': opentime.to_timecode(self.source_in, self._rate),
-            'src_out': opentime.to_timecode(self.source_out, self._rate),
-            'rec_in': opentime.to_timecode(self.record_in, self._rate),
-            'rec_out': opentime.to_timecode(self.record_out, self._rate),
-            'diss': int(
-                opentime.to_frames(self.dissolve_length, self._rate)
-            ),
-        }
+        rate = self._rate
+        timecodes = "{} {} {} {}".format(
+            opentime.to_timecode(self.source_in, rate),
+            opentime.to_timecode(self.source_out, rate),
+            opentime.to_timecode(self.record_in, rate),
+            opentime.to_timecode(self.record_out, rate),
+        )
 
         if self.is_dissolve():
-            return "{edit:03d}  {reel:8} {kind:5} D {diss:03d}    " \
-                "{src_in} {src_out} {rec_in} {rec_out}".format(**ser)
+            diss = int(opentime.to_frames(self.dissolve_length, rate))
+            return "{:03d}  {:8} {:5} D {:03d}    {}".format(
+                edit_number, self.reel, self._kind, diss, timecodes
+            )
         else:
-            return "{edit:03d}  {reel:8} {kind:5} C        " \
-                "{src_in} {src_out} {rec_in} {rec_out}".format(**ser)
+            return "{:03d}  {:8} {:5} C        {}".format(
+                edit_number, self.reel, self._kind, timecodes
+            )
 
     def is_dissolve(self):
         return self.dissolve_length.value > 0
@@ -1214,10 +1356,12 @@ def _generate_comment_lines(
     if not clip or isinstance(clip, schema.Gap):
         return []
 
-    suffix = ''
     timing_effect = _relevant_timing_effect(clip)
-    if timing_effect and timing_effect.effect_name == 'FreezeFrame':
-        suffix = ' FF'
+    is_freeze_frame = (
+        timing_effect is not None
+        and timing_effect.effect_name == 'FreezeFrame'
+    )
+    suffix = ' FF' if is_freeze_frame else ''
 
     if clip.media_reference:
         if hasattr(clip.media_reference, 'target_url'):
@@ -1233,7 +1377,7 @@ def _generate_comment_lines(
     else:
         url = clip.name
 
-    if from_or_to not in ['FROM', 'TO']:
+    if from_or_to not in {'FROM', 'TO'}:
         raise exceptions.NotSupportedError(
             "The clip FROM or TO value '{}' is not supported.".format(
                 from_or_to
@@ -1262,7 +1406,7 @@ def _generate_comment_lines(
                 suffix=suffix
             )
         )
-    if timing_effect and timing_effect.effect_name == "FreezeFrame":
+    if is_freeze_frame:
         lines.append('* * FREEZE FRAME')
 
     # If the style has a spec, apply it and add it as a comment
@@ -1280,7 +1424,8 @@ def _generate_comment_lines(
                 url=_flip_windows_slashes(url)
             ))
 
-    if reelname_len and not clip.metadata.get('cmx_3600', {}).get('reel'):
+    cmx_metadata = clip.metadata.get('cmx_3600', {})
+    if reelname_len and not cmx_metadata.get('reel'):
         lines.append("* OTIO TRUNCATED REEL NAME FROM: {url}".format(
             url=os.path.basename(_flip_windows_slashes(url or clip.name))
         ))
@@ -1327,13 +1472,113 @@ def _generate_comment_lines(
 
     # If we are carrying any unhandled CMX 3600 comments on this clip
     # then output them blindly.
-    extra_comments = clip.metadata.get('cmx_3600', {}).get('comments', [])
+    extra_comments = cmx_metadata.get('comments', [])
     for comment in extra_comments:
         lines.append(f"* {comment}")
 
     return lines
 
 
+def _is_wipe(transition_type):
+    """Return True for a wipe transition code, W### where ### is the code."""
+    return (
+        transition_type[:1] == 'W'
+        and len(transition_type) >= 4
+        and transition_type[1:4].isdecimal()
+    )
+
+
+def _parse_asc_sop(asc_sop):
+    """Return the slope, offset and power lists of an ASC_SOP comment body.
+
+    The body is three parenthesized groups of three decimals separated by
+    single spaces, e.g. ``(1.0 1.0 1.0) (0.0 0.0 0.0) (1.0 1.0 1.0)``, and some
+    tools put a comma after each value. Returns None if the body doesn't have
+    that structure.
+    """
+    groups = asc_sop.split(')')
+    if len(groups) < 4:
+        return None
+
+    triples = []
+    for idx, group in enumerate(groups[:3]):
+        # whitespace is only allowed between the groups
+        if idx:
+            group = group.lstrip()
+        if not group.startswith('('):
+            return None
+
+        values = []
+        for token in group[1:].split(' '):
+            if token.endswith(','):
+                token = token[:-1]
+            digits = token[1:] if token[:1] in '+-' else token
+            if not digits or digits.strip('0123456789.'):
+                return None
+            try:
+                values.append(float(token))
+            except ValueError:
+                return None
+        if len(values) != 3:
+            return None
+        triples.append(values)
+
+    return triples
+
+
+def _parse_edit_number(line):
+    """Return the edit number at the start of an event line, or None.
+
+    Comment lines are rejected on their first character so that only event
+    lines go through EDIT_NUMBER_RE.
+    """
+    if not line[:1].isdecimal():
+        return None
+
+    return int(EDIT_NUMBER_RE.match(line).group(0))
+
+
+def _parse_locator(locator):
+    """Split a locator comment body into its timecode, color and name.
+
+    Locators look like ``01:00:01:14 RED     ANIM FIX NEEDED``: a timecode,
+    whitespace, an optional color word and the rest of the line as the name.
+    This is done with slicing rather than a regex and accepts exactly what
+    ``([0-9]{2}:){3}[0-9]{2}\\s+(\\w*)(\\s+|$)(.*)`` would. Returns None if the
+    locator is malformed.
+    """
+    timecode = locator[:11]
+    if not (
+        len(timecode) == 11
+        and timecode.isascii()
+        and timecode[2] == timecode[5] == timecode[8] == ':'
+        and all(timecode[i:i + 2].isdecimal() for i in (0, 3, 6, 9))
+    ):
+        return None
+
+    rest = locator[11:]
+    body = rest.lstrip()
+    leading_whitespace = len(rest) - len(body)
+    if not leading_whitespace:
+        return None
+
+    # the color is the run of word characters after the timecode
+    end = 0
+    while end < len(body) and (body[end].isalnum() or body[end] == '_'):
+        end += 1
+    color, tail = body[:end], body[end:]
+    if not tail or tail[0].isspace():
+        return timecode, color, tail.lstrip()
+
+    # Anything else after separating whitespace is a name with no color,
+    # e.g. ``01:00:04:06  -name``, as long as there is still whitespace left
+    # to separate the (empty) color from the name.
+    if leading_whitespace > 1:
+        return timecode, '', body
+
+    return None
+
+
 def _get_image_sequence_url(clip):
     ref = clip.media_reference
     start_frame, end_frame = ref.frame_range_for_time_range(
@@ -1351,20 +1596,27 @@ def _get_image_sequence_url(clip):
 
 
 def _flip_windows_slashes(path):
-    return re.sub(r'\\', '/', path)
+    return path.replace('\\', '/')
+
+
+# Media references we can derive a reel name from
+_REEL_NAME_REFERENCE_TYPES = (
+    schema.ExternalReference,
+    schema.ImageSequenceReference,
+)
 
 
 def _reel_from_clip(clip, reelname_len):
     if isinstance(clip, schema.Gap):
         return 'BL'
 
-    elif clip.metadata.get('cmx_3600', {}).get('reel'):
-        return clip.metadata.get('cmx_3600').get('reel')
+    metadata_reel = clip.metadata.get('cmx_3600', {}).get('reel')
+    if metadata_reel:
+        return metadata_reel
 
     _reel = clip.name or 'AX'
 
-    valid_refs = (schema.ExternalReference, schema.ImageSequenceReference)
-    if isinstance(clip.media_reference, valid_refs):
+    if isinstance(clip.media_reference, _REEL_NAME_REFERENCE_TYPES):
         if clip.media_reference.name:
             _reel = clip.media_reference.name
 
@@ -1380,16 +1632,13 @@ def _reel_from_clip(clip, reelname_len):
     _reel = os.path.basename(_flip_windows_slashes(_reel))
 
     # Strip extension
-    reel = re.sub(r'([.][a-zA-Z]+)$', '', _reel)
+    reel = REEL_EXTENSION_RE.sub('', _reel)
 
     if reelname_len:
         # Remove non valid characters
-        reel = re.sub(r'[^ a-zA-Z0-9]+', '', reel)
-
-        if len(reel) > reelname_len:
-            reel = reel[:reelname_len]
+        reel = REEL_INVALID_CHARS_RE.sub('', reel)
 
-        elif len(reel) < reelname_len:
-            reel += ' ' * (reelname_len - len(reel))
+        # Truncate or pad to exactly reelname_len characters
+        reel = reel[:reelname_len].ljust(reelname_len)
 
     return reel
@@ -1,3 +1,4 @@
+import copy
 import re
 from pathlib import Path
 
@@ -7,7 +8,7 @@ from opentimelineio import adapters, plugins
 import otio_cmx3600_adapter.cmx_3600
 
 
-@fixture
+@fixture(scope="session")
 def cmx_adapter():
     # Use OTIO's native plugin loading system
     # This verifies that the adapter is being correctly registered and
@@ -27,6 +28,33 @@ def cmx_adapter():
     return adapter
 
 
+@fixture(scope="session")
+def read_sample_edl(cmx_adapter):
+    """Read an EDL with the adapter, parsing each file only once per session.
+
+    Every call returns a fresh copy of the timeline, so tests are free to
+    modify what they get back.
+    """
+    timelines = {}
+
+    def read(edl_path, **kwargs):
+        key = (str(edl_path), tuple(sorted(kwargs.items())))
+        if key not in timelines:
+            timelines[key] = cmx_adapter.read_from_file(edl_path, **kwargs)
+        return copy.deepcopy(timelines[key])
+
+    return read
+
+
+@fixture(scope="module")
+def round_trip_dir(tmp_path_factory):
+    """A temporary directory shared by the round-trip tests in a module.
+
+    Tests must write to file names unique to themselves.
+    """
+    return tmp_path_factory.mktemp("round_trip")
+
+
 @fixture
 def assertJsonEqual():
     """Convert to json and compare that (more readable)."""
@@ -2,20 +2,20 @@
 # Copyright Contributors to the OpenTimelineIO project
 
 # python
-import os
+from pathlib import Path
 
 import pytest
 import opentimelineio as otio
 
 __doc__ = """Test CDL support in the EDL adapter."""
 
-SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
-CDL_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "cdl.edl")
+SAMPLE_DATA_DIR = Path(__file__).parent / "sample_data"
+CDL_EXAMPLE_PATH = SAMPLE_DATA_DIR / "cdl.edl"
 
 
-def test_cdl_read(cmx_adapter):
+def test_cdl_read(read_sample_edl):
     edl_path = CDL_EXAMPLE_PATH
-    timeline = cmx_adapter.read_from_file(edl_path)
+    timeline = read_sample_edl(edl_path)
     assert timeline is not None
     assert len(timeline.tracks) == 1
     assert len(timeline.tracks[0]) == 2
@@ -94,3 +94,37 @@ def test_cdl_round_trip(cmx_adapter):
     timeline = cmx_adapter.read_from_string(original)
     output = cmx_adapter.write_to_string(timeline)
     assert expected == output
+
+
+@pytest.mark.parametrize(
+    "asc_sop",
+    [
+        pytest.param("(0.1 0.2 0.3) (1.0 -0.0122 0.0305) (1.0 0.0)",
+                     id="short-power"),
+        pytest.param("0.1 0.2 0.3 1.0 -0.0122 0.0305 1.0 0.0 1.0",
+                     id="no-parentheses"),
+        pytest.param("(0.1 0.2) (0.3 1.0 -0.0122 0.0305) (1.0 0.0 1.0)",
+                     id="misgrouped"),
+        pytest.param("(0.1 0.2 0.3) (1.0 -0.0122 0.0305) (1.0 0.0 1.0 2.0)",
+                     id="extra-value"),
+        pytest.param("(0.1 0.2 0.3) (1.0 -0.0122 0.0305) (1.0 0.0 1.0 x)",
+                     id="trailing-junk"),
+        pytest.param("(1e3 0.2 0.3) (1.0 -0.0122 0.0305) (1.0 0.0 1.0)",
+                     id="exponent"),
+        pytest.param("(nan 0.2 0.3) (1.0 -0.0122 0.0305) (1.0 0.0 1.0)",
+                     id="nan"),
+        pytest.param("(inf 0.2 0.3) (1.0 -0.0122 0.0305) (1.0 0.0 1.0)",
+                     id="inf"),
+        pytest.param("(1.2.3 0.2 0.3) (1.0 -0.0122 0.0305) (1.0 0.0 1.0)",
+                     id="bad-decimal"),
+    ],
+)
+def test_cdl_read_invalid_sop(cmx_adapter, asc_sop):
+    cdl = f"""TITLE: Example_Screening.01
+
+001  AX       V     C        01:00:04:05 01:00:05:12 00:00:00:00 00:00:01:07
+* FROM CLIP NAME:  ZZ100_501 (LAY3)
+*ASC_SOP {asc_sop}
+"""
+    with pytest.raises(otio.exceptions.OTIOError):
+        cmx_adapter.read_from_string(cdl)
@@ -6,38 +6,45 @@
 """Test the CMX 3600 EDL adapter."""
 
 # python
-import os
+import filecmp
 from pathlib import Path
 
 import pytest
 import opentimelineio as otio
 
 # List of sample files used in tests
-SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
-SCREENING_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "screening_example.edl")
-AVID_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "avid_example.edl")
-NUCODA_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "nucoda_example.edl")
-PREMIERE_EXAMPLE_PATH = os.path.join(SAMPLE_DATA_DIR, "premiere_example.edl")
-EXEMPLE_25_FPS_PATH = os.path.join(SAMPLE_DATA_DIR, "25fps.edl")
-NO_SPACES_PATH = os.path.join(SAMPLE_DATA_DIR, "no_spaces_test.edl")
-DISSOLVE_TEST = os.path.join(SAMPLE_DATA_DIR, "dissolve_test.edl")
-DISSOLVE_TEST_2 = os.path.join(SAMPLE_DATA_DIR, "dissolve_test_2.edl")
-DISSOLVE_TEST_3 = os.path.join(SAMPLE_DATA_DIR, "dissolve_test_3.edl")
-DISSOLVE_TEST_4 = os.path.join(SAMPLE_DATA_DIR, "dissolve_test_4.edl")
-GAP_TEST = os.path.join(SAMPLE_DATA_DIR, "gap_test.edl")
-WIPE_TEST = os.path.join(SAMPLE_DATA_DIR, "wipe_test.edl")
-TIMECODE_MISMATCH_TEST = os.path.join(SAMPLE_DATA_DIR, "timecode_mismatch.edl")
-SPEED_EFFECTS_TEST = os.path.join(SAMPLE_DATA_DIR, "speed_effects.edl")
-SPEED_EFFECTS_TEST_SMALL = os.path.join(SAMPLE_DATA_DIR, "speed_effects_small.edl")
-MULTIPLE_TARGET_AUDIO_PATH = os.path.join(SAMPLE_DATA_DIR, "multi_audio.edl")
-TRANSITION_DURATION_TEST = os.path.join(SAMPLE_DATA_DIR, "transition_duration.edl")
-ENABLED_TEST = os.path.join(SAMPLE_DATA_DIR, "enabled.otio")
-
-
-def test_edl_read(cmx_adapter):
+SAMPLE_DATA_DIR = Path(__file__).parent / "sample_data"
+SCREENING_EXAMPLE_PATH = SAMPLE_DATA_DIR / "screening_example.edl"
+AVID_EXAMPLE_PATH = SAMPLE_DATA_DIR / "avid_example.edl"
+NUCODA_EXAMPLE_PATH = SAMPLE_DATA_DIR / "nucoda_example.edl"
+PREMIERE_EXAMPLE_PATH = SAMPLE_DATA_DIR / "premiere_example.edl"
+EXEMPLE_25_FPS_PATH = SAMPLE_DATA_DIR / "25fps.edl"
+NO_SPACES_PATH = SAMPLE_DATA_DIR / "no_spaces_test.edl"
+DISSOLVE_TEST = SAMPLE_DATA_DIR / "dissolve_test.edl"
+DISSOLVE_TEST_2 = SAMPLE_DATA_DIR / "dissolve_test_2.edl"
+DISSOLVE_TEST_3 = SAMPLE_DATA_DIR / "dissolve_test_3.edl"
+DISSOLVE_TEST_4 = SAMPLE_DATA_DIR / "dissolve_test_4.edl"
+GAP_TEST = SAMPLE_DATA_DIR / "gap_test.edl"
+WIPE_TEST = SAMPLE_DATA_DIR / "wipe_test.edl"
+TIMECODE_MISMATCH_TEST = SAMPLE_DATA_DIR / "timecode_mismatch.edl"
+SPEED_EFFECTS_TEST = SAMPLE_DATA_DIR / "speed_effects.edl"
+SPEED_EFFECTS_TEST_SMALL = SAMPLE_DATA_DIR / "speed_effects_small.edl"
+MULTIPLE_TARGET_AUDIO_PATH = SAMPLE_DATA_DIR / "multi_audio.edl"
+TRANSITION_DURATION_TEST = SAMPLE_DATA_DIR / "transition_duration.edl"
+ENABLED_TEST = SAMPLE_DATA_DIR / "enabled.otio"
+
+# Five frame source range used by the clips built in the writer tests. Time
+# values are immutable so the one instance can be shared by all of them.
+FIVE_FRAME_RANGE = otio.opentime.TimeRange(
+    start_time=otio.opentime.RationalTime(0.0, 24.0),
+    duration=otio.opentime.RationalTime(5.0, 24.0),
+)
+
+
+def test_edl_read(read_sample_edl):
     edl_path = SCREENING_EXAMPLE_PATH
     fps = 24
-    timeline = cmx_adapter.read_from_file(edl_path)
+    timeline = read_sample_edl(edl_path)
     assert timeline is not None
     assert len(timeline.tracks) == 1
     assert len(timeline.tracks[0]) == 9
@@ -95,15 +102,12 @@ def test_edl_read(cmx_adapter):
 def test_reelname_length(cmx_adapter):
     track = otio.schema.Track()
     tl = otio.schema.Timeline("test_timeline", tracks=[track])
-    rt = otio.opentime.RationalTime(5.0, 24.0)
 
     long_mr = otio.schema.ExternalReference(
         target_url="/var/tmp/test_a_really_really_long_filename.mov"
     )
 
-    tr = otio.opentime.TimeRange(
-        start_time=otio.opentime.RationalTime(0.0, 24.0), duration=rt
-    )
+    tr = FIVE_FRAME_RANGE
 
     cl = otio.schema.Clip(
         name="test clip1",
@@ -155,7 +159,6 @@ V     C        00:00:00:00 00:00:00:05 00:00:00:00 00:00:00:05
 def test_edl_round_trip_mem2disk2mem(cmx_adapter, assertJsonEqual):
     track = otio.schema.Track()
     tl = otio.schema.Timeline("test_timeline", tracks=[track])
-    rt = otio.opentime.RationalTime(5.0, 24.0)
     mr = otio.schema.ExternalReference(target_url="/var/tmp/test.mov")
     md = {
         "cmx_3600": {
@@ -164,9 +167,7 @@ def test_edl_round_trip_mem2disk2mem(cmx_adapter, assertJsonEqual):
         }
     }
 
-    tr = otio.opentime.TimeRange(
-        start_time=otio.opentime.RationalTime(0.0, 24.0), duration=rt
-    )
+    tr = FIVE_FRAME_RANGE
 
     cl = otio.schema.Clip(
         name="test clip1", media_reference=mr, source_range=tr, metadata=md
@@ -223,14 +224,12 @@ def test_edl_round_trip_mem2disk2mem(cmx_adapter, assertJsonEqual):
 
 
 def test_edl_round_trip_disk2mem2disk_speed_effects(
-    cmx_adapter, assertJsonEqual, tmp_path: Path
+    cmx_adapter, read_sample_edl, assertJsonEqual, round_trip_dir: Path
 ):
     test_edl = SPEED_EFFECTS_TEST_SMALL
-    timeline = cmx_adapter.read_from_file(test_edl)
+    timeline = read_sample_edl(test_edl)
 
-    tmp_path = os.path.join(
-        tmp_path, "test_edl_round_trip_disk2mem2disk_speed_effects.edl"
-    )
+    tmp_path = round_trip_dir / "test_edl_round_trip_disk2mem2disk_speed_effects.edl"
 
     cmx_adapter.write_to_file(timeline, tmp_path)
 
@@ -249,11 +248,11 @@ def test_edl_round_trip_disk2mem2disk_speed_effects(
 
 
 def test_edl_round_trip_disk2mem2disk(
-    cmx_adapter, assertIsOTIOEquivalentTo, tmp_path: Path
+    cmx_adapter, read_sample_edl, assertIsOTIOEquivalentTo, round_trip_dir: Path
 ):
-    timeline = cmx_adapter.read_from_file(SCREENING_EXAMPLE_PATH)
+    timeline = read_sample_edl(SCREENING_EXAMPLE_PATH)
 
-    tmp_path = os.path.join(tmp_path, "test_edl_round_trip_disk2mem2disk.edl")
+    tmp_path = round_trip_dir / "test_edl_round_trip_disk2mem2disk.edl"
 
     cmx_adapter.write_to_file(timeline, tmp_path)
 
@@ -274,15 +273,14 @@ def test_edl_round_trip_disk2mem2disk(
     # When debugging, use this to see the difference in the EDLs on disk
     # os.system("opendiff {} {}".format(SCREENING_EXAMPLE_PATH, tmp_path))
 
-    # But the EDL text on disk are *not* byte-for-byte identical
-    with open(SCREENING_EXAMPLE_PATH) as original_file:
-        with open(tmp_path) as output_file:
-            assert original_file.read() != output_file.read()
+    # But the EDL text on disk are *not* byte-for-byte identical. filecmp
+    # compares in chunks and stops at the first difference.
+    assert not filecmp.cmp(SCREENING_EXAMPLE_PATH, tmp_path, shallow=False)
 
 
-def test_regex_flexibility(cmx_adapter, assertIsOTIOEquivalentTo):
-    timeline = cmx_adapter.read_from_file(SCREENING_EXAMPLE_PATH)
-    no_spaces = cmx_adapter.read_from_file(NO_SPACES_PATH)
+def test_regex_flexibility(read_sample_edl, assertIsOTIOEquivalentTo):
+    timeline = read_sample_edl(SCREENING_EXAMPLE_PATH)
+    no_spaces = read_sample_edl(NO_SPACES_PATH)
     assertIsOTIOEquivalentTo(timeline, no_spaces)
 
 
@@ -320,31 +318,25 @@ def test_imagesequence_read(cmx_adapter):
         otio.opentime.from_timecode("01:00:02:12", rate),
     )
 
+
+@pytest.mark.parametrize(
+    "media_file",
+    ["my_image_file.1025.ext", "my_image_file.[1025].ext"],
+    ids=["single-frame", "bracket-single"],
+)
+def test_imagesequence_read_non_sequence(cmx_adapter, media_file):
     # Make sure regex works and uses ExternalReference for non sequences
-    trunced_edl2 = """TITLE: Image Sequence Write
+    trunced_edl = f"""TITLE: Image Sequence Write
 
 001  myimages V     C        01:00:01:00 01:00:02:12 00:00:00:00 00:00:01:12
 * FROM CLIP NAME:  my_image_sequence
-* FROM CLIP: /media/path/my_image_file.1025.ext
-* OTIO TRUNCATED REEL NAME FROM: my_image_file.1025.ext
+* FROM CLIP: /media/path/{media_file}
+* OTIO TRUNCATED REEL NAME FROM: {media_file}
 """
 
-    tl2 = cmx_adapter.read_from_string(trunced_edl2, rate=rate)
-    clip2 = tl2.tracks[0][0]
-    media_ref2 = clip2.media_reference
-    assert isinstance(media_ref2, otio.schema.ExternalReference)
-
-    trunced_edl3 = """TITLE: Image Sequence Write
-
-001  myimages V     C        01:00:01:00 01:00:02:12 00:00:00:00 00:00:01:12
-* FROM CLIP NAME:  my_image_sequence
-* FROM CLIP: /media/path/my_image_file.[1025].ext
-* OTIO TRUNCATED REEL NAME FROM: my_image_file.[1025].ext
-"""
-    tl3 = cmx_adapter.read_from_string(trunced_edl3, rate=rate)
-    clip3 = tl3.tracks[0][0]
-    media_ref3 = clip3.media_reference
-    assert isinstance(media_ref3, otio.schema.ExternalReference)
+    tl = cmx_adapter.read_from_string(trunced_edl, rate=24)
+    media_ref = tl.tracks[0][0].media_reference
+    assert isinstance(media_ref, otio.schema.ExternalReference)
 
 
 def test_imagesequence_write(cmx_adapter):
@@ -399,8 +391,8 @@ def test_imagesequence_write(cmx_adapter):
     assert result2 == expected_result2
 
 
-def test_dissolve_parse(cmx_adapter):
-    tl = cmx_adapter.read_from_file(DISSOLVE_TEST)
+def test_dissolve_parse(read_sample_edl):
+    tl = read_sample_edl(DISSOLVE_TEST)
     # clip/transition/clip/clip
     assert len(tl.tracks[0]) == 4
 
@@ -419,8 +411,8 @@ def test_dissolve_parse(cmx_adapter):
     assert tl.tracks[0][2].name == "clip_B"
 
 
-def test_dissolve_parse_middle(cmx_adapter):
-    tl = cmx_adapter.read_from_file(DISSOLVE_TEST_2)
+def test_dissolve_parse_middle(read_sample_edl):
+    tl = read_sample_edl(DISSOLVE_TEST_2)
     trck = tl.tracks[0]
     # 3 clips and 1 transition
     assert len(trck) == 4
@@ -443,8 +435,8 @@ def test_dissolve_parse_middle(cmx_adapter):
     assert tl.tracks[0][0].visible_range().duration.to_frames() == 15
 
 
-def test_dissolve_parse_full_clip_dissolve(cmx_adapter):
-    tl = cmx_adapter.read_from_file(DISSOLVE_TEST_3)
+def test_dissolve_parse_full_clip_dissolve(read_sample_edl):
+    tl = read_sample_edl(DISSOLVE_TEST_3)
     assert len(tl.tracks[0]) == 4
 
     assert isinstance(tl.tracks[0][1], otio.schema.Transition)
@@ -487,8 +479,8 @@ def test_dissolve_with_odd_frame_count_maintains_length(cmx_adapter):
     assert tl.duration().value == (11 * 24) + 12
 
 
-def test_wipe_parse(cmx_adapter):
-    tl = cmx_adapter.read_from_file(WIPE_TEST)
+def test_wipe_parse(read_sample_edl):
+    tl = read_sample_edl(WIPE_TEST)
     assert len(tl.tracks[0]) == 4
 
     wipe = tl.tracks[0][1]
@@ -522,19 +514,19 @@ def test_fade_to_black(cmx_adapter):
     assert tl.tracks[0][2].source_range.start_time.value == 0
 
 
-DISSOLVE_TESTS = [DISSOLVE_TEST, DISSOLVE_TEST_2, DISSOLVE_TEST_3, DISSOLVE_TEST_4]
+DISSOLVE_TESTS = sorted(SAMPLE_DATA_DIR.glob("dissolve_test*.edl"))
 
 
-@pytest.mark.parametrize(
-    "edl_file", DISSOLVE_TESTS, ids=[os.path.basename(path) for path in DISSOLVE_TESTS]
-)
-def test_edl_round_trip_with_transitions(cmx_adapter, tmp_path: Path, edl_file):
+@pytest.mark.parametrize("edl_file", DISSOLVE_TESTS, ids=lambda path: path.name)
+def test_edl_round_trip_with_transitions(
+    cmx_adapter, read_sample_edl, round_trip_dir: Path, edl_file
+):
     # Notes:
     # - the writer does not handle wipes, only dissolves
     # - the writer can generate invalid EDLs if spaces are in reel names.
-    edl_name = os.path.basename(edl_file)
-    timeline = cmx_adapter.read_from_file(edl_file)
-    tmp_path = os.path.join(tmp_path, f"test_edl_round_trip_{edl_name}")
+    edl_name = edl_file.name
+    timeline = read_sample_edl(edl_file)
+    tmp_path = round_trip_dir / f"test_edl_round_trip_{edl_name}"
     cmx_adapter.write_to_file(timeline, tmp_path)
 
     result = cmx_adapter.read_from_file(tmp_path)
@@ -551,11 +543,11 @@ def test_edl_round_trip_with_transitions(cmx_adapter, tmp_path: Path, edl_file):
                 assert child.source_range == res_child.source_range
 
 
-def test_edl_25fps(cmx_adapter):
+def test_edl_25fps(read_sample_edl):
     # EXERCISE
     edl_path = EXEMPLE_25_FPS_PATH
     fps = 25
-    timeline = cmx_adapter.read_from_file(edl_path, rate=fps)
+    timeline = read_sample_edl(edl_path, rate=fps)
     track = timeline.tracks[0]
     assert track[0].source_range.duration.value == 161
     assert track[1].source_range.duration.value == 200
@@ -563,9 +555,18 @@ def test_edl_25fps(cmx_adapter):
     assert track[3].source_range.duration.value == 49
 
 
-def test_record_gaps(cmx_adapter):
+# (start, duration) in frames of each item in gap_test.edl's track
+RECORD_GAP_RANGES = [
+    otio.opentime.TimeRange(
+        otio.opentime.from_frames(start, 24), otio.opentime.from_frames(duration, 24)
+    )
+    for start, duration in [(0, 24), (24, 16), (40, 24), (64, 38), (102, 24)]
+]
+
+
+def test_record_gaps(read_sample_edl):
     edl_path = GAP_TEST
-    timeline = cmx_adapter.read_from_file(edl_path)
+    timeline = read_sample_edl(edl_path)
     track = timeline.tracks[0]
     assert len(track) == 5
     assert track.duration().value == 5 * 24 + 6
@@ -578,23 +579,7 @@ def test_record_gaps(cmx_adapter):
     assert clip1.range_in_parent().duration.value == 24
     assert clip2.range_in_parent().duration.value == 24
     assert clip3.range_in_parent().duration.value == 24
-    assert [item.range_in_parent() for item in track] == [
-        otio.opentime.TimeRange(
-            otio.opentime.from_frames(0, 24), otio.opentime.from_frames(24, 24)
-        ),
-        otio.opentime.TimeRange(
-            otio.opentime.from_frames(24, 24), otio.opentime.from_frames(16, 24)
-        ),
-        otio.opentime.TimeRange(
-            otio.opentime.from_frames(40, 24), otio.opentime.from_frames(24, 24)
-        ),
-        otio.opentime.TimeRange(
-            otio.opentime.from_frames(64, 24), otio.opentime.from_frames(38, 24)
-        ),
-        otio.opentime.TimeRange(
-            otio.opentime.from_frames(102, 24), otio.opentime.from_frames(24, 24)
-        ),
-    ]
+    assert [item.range_in_parent() for item in track] == RECORD_GAP_RANGES
 
 
 def test_read_generators(cmx_adapter):
@@ -611,70 +596,58 @@ def test_read_generators(cmx_adapter):
     assert tl.tracks[0][2].media_reference.generator_kind == "SMPTEBars"
 
 
-def test_style_edl_read(cmx_adapter, assertIsOTIOEquivalentTo):
-    edl_paths = [AVID_EXAMPLE_PATH, NUCODA_EXAMPLE_PATH, PREMIERE_EXAMPLE_PATH]
-    for edl_path in edl_paths:
-        fps = 24
-        timeline = cmx_adapter.read_from_file(edl_path)
-        assert timeline is not None
-        assert len(timeline.tracks) == 1
-        assert len(timeline.tracks[0]) == 2
-
-        # If cannot assertEqual fails with clip name
-        # Attempt to assertEqual with
-        try:
-            assert timeline.tracks[0][0].name == "take_1"
-        except AssertionError:
-            assert timeline.tracks[0][0].name == "ZZ100_501.take_1.0001.exr"
-        assert timeline.tracks[0][
-            0
-        ].source_range.duration == otio.opentime.from_timecode("00:00:01:07", fps)
-
-        try:
-            assertIsOTIOEquivalentTo(
-                timeline.tracks[0][0].media_reference,
-                otio.schema.ExternalReference(
-                    target_url=r"S:\path\to\ZZ100_501.take_1.0001.exr"
-                ),
-            )
-        except AssertionError:
-            assertIsOTIOEquivalentTo(
-                timeline.tracks[0][0].media_reference,
-                otio.schema.MissingReference(),
-            )
-
-        try:
-            assert timeline.tracks[0][1].name == "take_2"
-        except AssertionError:
-            assert timeline.tracks[0][1].name == "ZZ100_502A.take_2.0101.exr"
-
-        assert timeline.tracks[0][
-            1
-        ].source_range.duration == otio.opentime.from_timecode("00:00:02:02", fps)
-
-        try:
-            assertIsOTIOEquivalentTo(
-                timeline.tracks[0][1].media_reference,
-                otio.schema.ExternalReference(
-                    target_url=r"S:\path\to\ZZ100_502A.take_2.0101.exr"
-                ),
-            )
-        except AssertionError:
-            assertIsOTIOEquivalentTo(
-                timeline.tracks[0][1].media_reference,
-                otio.schema.MissingReference(),
-            )
+TAKE_1_URL = r"S:\path\to\ZZ100_501.take_1.0001.exr"
+TAKE_2_URL = r"S:\path\to\ZZ100_502A.take_2.0101.exr"
+
+# The clip names and media urls each EDL style is expected to read as. A
+# url of None means the style carries no media path, so the clip gets a
+# MissingReference.
+STYLE_EDL_CLIPS = {
+    "avid": (AVID_EXAMPLE_PATH, [("take_1", TAKE_1_URL), ("take_2", TAKE_2_URL)]),
+    "nucoda": (NUCODA_EXAMPLE_PATH, [("take_1", TAKE_1_URL), ("take_2", TAKE_2_URL)]),
+    "premiere": (
+        PREMIERE_EXAMPLE_PATH,
+        [("ZZ100_501.take_1.0001.exr", None), ("ZZ100_502A.take_2.0101.exr", None)],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    ("edl_path", "expected_clips"),
+    list(STYLE_EDL_CLIPS.values()),
+    ids=list(STYLE_EDL_CLIPS),
+)
+def test_style_edl_read(
+    read_sample_edl, assertIsOTIOEquivalentTo, edl_path, expected_clips
+):
+    fps = 24
+    timeline = read_sample_edl(edl_path)
+    assert timeline is not None
+    assert len(timeline.tracks) == 1
+    assert len(timeline.tracks[0]) == 2
+
+    durations = ["00:00:01:07", "00:00:02:02"]
+    for clip, (name, url), duration in zip(
+        timeline.tracks[0], expected_clips, durations
+    ):
+        assert clip.name == name
+        assert clip.source_range.duration == otio.opentime.from_timecode(
+            duration, fps
+        )
+
+        if url is None:
+            expected_reference = otio.schema.MissingReference()
+        else:
+            expected_reference = otio.schema.ExternalReference(target_url=url)
+        assert assertIsOTIOEquivalentTo(clip.media_reference, expected_reference)
 
 
 def test_style_edl_write(cmx_adapter):
     track = otio.schema.Track()
     tl = otio.schema.Timeline("temp", tracks=[track])
-    rt = otio.opentime.RationalTime(5.0, 24.0)
     mr = otio.schema.ExternalReference(target_url=r"S:/var/tmp/test.exr")
 
-    tr = otio.opentime.TimeRange(
-        start_time=otio.opentime.RationalTime(0.0, 24.0), duration=rt
-    )
+    tr = FIVE_FRAME_RANGE
     cl = otio.schema.Clip(
         name="test clip1",
         media_reference=mr,
@@ -948,8 +921,8 @@ def test_nucoda_edl_write_with_double_transition(cmx_adapter):
     assert result == expected
 
 
-def test_read_edl_with_multiple_target_audio_tracks(cmx_adapter):
-    tl = cmx_adapter.read_from_file(MULTIPLE_TARGET_AUDIO_PATH)
+def test_read_edl_with_multiple_target_audio_tracks(read_sample_edl):
+    tl = read_sample_edl(MULTIPLE_TARGET_AUDIO_PATH)
 
     assert len(tl.audio_tracks()) == 2
 
@@ -995,13 +968,13 @@ def test_invalid_edl_style_raises_exception(cmx_adapter):
         cmx_adapter.write_to_string(tl, style="bogus")
 
 
-def test_invalid_record_timecode(cmx_adapter):
+def test_invalid_record_timecode(cmx_adapter, read_sample_edl):
     with pytest.raises(ValueError):
         tl = cmx_adapter.read_from_file(TIMECODE_MISMATCH_TEST)
     with pytest.raises(cmx_adapter.module().EDLParseError):
         tl = cmx_adapter.read_from_file(TIMECODE_MISMATCH_TEST, rate=25)
 
-    tl = cmx_adapter.read_from_file(
+    tl = read_sample_edl(
         TIMECODE_MISMATCH_TEST, rate=25, ignore_timecode_mismatch=True
     )
     assert tl.tracks[0][3].range_in_parent() == otio.opentime.TimeRange(
@@ -1030,8 +1003,8 @@ def test_can_read_frame_cut_points(cmx_adapter):
     assert tl.tracks[0][3].duration().value == 276 - 84
 
 
-def test_speed_effects(cmx_adapter):
-    tl = cmx_adapter.read_from_file(SPEED_EFFECTS_TEST)
+def test_speed_effects(read_sample_edl):
+    tl = read_sample_edl(SPEED_EFFECTS_TEST)
     assert tl.duration() == otio.opentime.from_timecode("00:21:03:18", 24)
 
     # Look for a clip with a freeze frame effect
@@ -1077,8 +1050,8 @@ def test_speed_effects(cmx_adapter):
     )
 
 
-def test_transition_duration(cmx_adapter):
-    tl = cmx_adapter.read_from_file(TRANSITION_DURATION_TEST)
+def test_transition_duration(read_sample_edl):
+    tl = read_sample_edl(TRANSITION_DURATION_TEST)
     assert len(tl.tracks[0]) == 5
 
     assert isinstance(tl.tracks[0][2], otio.schema.Transition)
@@ -1086,11 +1059,11 @@ def test_transition_duration(cmx_adapter):
     assert tl.tracks[0][2].duration().value == 26.0
 
 
-def test_three_part_transition(cmx_adapter):
+def test_three_part_transition(read_sample_edl):
     """
     Test A->B->C Transition
     """
-    tl = cmx_adapter.read_from_file(DISSOLVE_TEST_4)
+    tl = read_sample_edl(DISSOLVE_TEST_4)
     assert len(tl.tracks[0]) == 8
 
     assert tl.tracks[0][0].duration().value == 30.0
@@ -1141,3 +1114,133 @@ def test_enabled(cmx_adapter):
 """
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("locator", "expected"),
+    [
+        pytest.param(
+            "01:00:04:06 CYAN    VFX  NOTE",
+            ("01:00:04:06", "CYAN", otio.schema.MarkerColor.CYAN, "VFX  NOTE"),
+            id="color-and-name",
+        ),
+        pytest.param(
+            "01:00:04:07 NOT_A_COLOR",
+            ("01:00:04:07", "NOT_A_COLOR", otio.schema.MarkerColor.RED, ""),
+            id="unknown-color",
+        ),
+        pytest.param(
+            "01:00:04:06  -name",
+            ("01:00:04:06", "", otio.schema.MarkerColor.RED, "-name"),
+            id="no-color",
+        ),
+        pytest.param("01:00:04:08", None, id="timecode-only"),
+        pytest.param("01:00:04:09 RED-X   invalid color", None, id="bad-color"),
+        pytest.param("01:00:04:06 -name", None, id="no-color-single-space"),
+        pytest.param("1:00:04:10 RED      bad timecode", None, id="short-timecode"),
+        pytest.param("0::00:04:06 RED x", None, id="misplaced-colon"),
+        pytest.param("01:00:04:\u00b26 RED x", None, id="superscript-digit"),
+        pytest.param("01:00:04:0\u0663 RED x", None, id="non-ascii-digit"),
+    ],
+)
+def test_locator_parsing(cmx_adapter, locator, expected):
+    edl = f"""TITLE: Locators
+
+001  AX       V     C        01:00:04:05 01:00:05:12 00:00:00:00 00:00:01:07
+* FROM CLIP NAME:  ZZ100_501 (LAY3)
+* LOC: {locator}
+"""
+    timeline = cmx_adapter.read_from_string(edl)
+    markers = timeline.tracks[0][0].markers
+
+    if expected is None:
+        assert len(markers) == 0
+        return
+
+    timecode, file_color, color, name = expected
+    assert len(markers) == 1
+    marker = markers[0]
+    assert marker.name == name
+    assert marker.color == color
+    assert marker.metadata["cmx_3600"]["color"] == file_color
+    assert marker.marked_range.start_time == otio.opentime.from_timecode(
+        timecode, 24
+    )
+
+
+def test_read_latin1_edl(cmx_adapter, tmp_path: Path):
+    edl = """TITLE: Latin-1
+
+001  AX       V     C        01:00:04:05 01:00:05:12 00:00:00:00 00:00:01:07
+* FROM CLIP NAME:  Café
+"""
+    edl_path = tmp_path / "latin1.edl"
+    edl_path.write_bytes(edl.encode("iso-8859-1"))
+
+    timeline = cmx_adapter.read_from_file(edl_path)
+    assert timeline.tracks[0][0].name == "Café"
+
+    edl_path.write_bytes(edl.encode("utf-8"))
+    timeline = cmx_adapter.read_from_file(edl_path)
+    assert timeline.tracks[0][0].name == "Café"
+
+
+def test_read_comment_with_non_breaking_space(cmx_adapter, tmp_path: Path):
+    edl = """TITLE: NBSP
+
+001  AX       V     C        01:00:04:05 01:00:05:12 00:00:00:00 00:00:01:07
+*\u00a0FROM CLIP NAME:\u00a0Caf\u00e9
+"""
+    timeline = cmx_adapter.read_from_string(edl)
+    assert timeline.tracks[0][0].name == "Caf\u00e9"
+
+    # Latin-1 files are where the non-breaking space usually comes from
+    edl_path = tmp_path / "nbsp.edl"
+    edl_path.write_bytes(edl.encode("iso-8859-1"))
+    timeline = cmx_adapter.read_from_file(edl_path)
+    assert timeline.tracks[0][0].name == "Caf\u00e9"
+
+
+def test_read_speed_effect_with_non_breaking_space(cmx_adapter, tmp_path: Path):
+    edl = """TITLE: NBSP
+
+001  Z686_5A. V     C        01:00:06:00 01:00:08:22 01:11:31:16 01:11:33:04
+M2   Z686_5A.\u00a0047.6\u00a001:00:06:00
+* FROM CLIP NAME:  Z686_5A (LAY2) (47.56 FPS)
+"""
+    edl_path = tmp_path / "nbsp_m2.edl"
+    edl_path.write_bytes(edl.encode("iso-8859-1"))
+    timeline = cmx_adapter.read_from_file(edl_path)
+    clip = timeline.tracks[0][0]
+    assert clip.effects and clip.effects[0].effect_name == "LinearTimeWarp"
+    assert clip.effects[0].time_scalar == pytest.approx(47.6 / 24)
+
+
+def test_comment_handler_custom_template(cmx_adapter):
+    cmx_3600 = cmx_adapter.module()
+
+    class EqualsCommentHandler(cmx_3600.CommentHandler):
+        regex_template = r"\*\s*{id}\s*=\s*(?P<comment_body>.*)"
+
+    handler = EqualsCommentHandler(
+        ["* FROM CLIP NAME = my clip", "* LOC: 01:00:00:00 RED"]
+    )
+    assert handler.handled == {"clip_name": "my clip"}
+    assert handler.unhandled == ["LOC: 01:00:00:00 RED"]
+
+    # templates may use named groups of their own
+    class PrefixedCommentHandler(cmx_3600.CommentHandler):
+        regex_template = r"(?P<prefix>\*+)\s*{id}:?\s*(?P<comment_body>.*)"
+
+    handler = PrefixedCommentHandler(["** FROM CLIP NAME: my clip"])
+    assert handler.handled == {"clip_name": "my clip"}
+
+    # and the default template is unaffected
+    handler = cmx_3600.CommentHandler(["* LOC: 01:00:00:00 RED"])
+    assert handler.handled == {"locators": ["01:00:00:00 RED"]}
+
+
+def test_write_empty_track(cmx_adapter):
+    tl = otio.schema.Timeline("empty_timeline", tracks=[otio.schema.Track()])
+    result = cmx_adapter.write_to_string(tl, rate=24)
+    assert result == "TITLE: empty_timeline\n\n"